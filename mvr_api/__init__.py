@@ -1,13 +1,48 @@
-from .client import MVRApiClient, MVRApiError, MVRClient
-from .models import MVRConfig, SandboxMarkers
+"""MVR API Python client.
+
+Public names are resolved lazily (PEP 562) so ``import mvr_api`` stays cheap: the
+HTTP clients load without Pydantic, and model schemas are only built when a model
+name is first accessed.
+"""
+
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, List
 
 __version__ = "6.32.1"
 
-__all__ = [
-    "MVRClient",
-    "MVRApiClient",
-    "MVRApiError",
-    "MVRConfig",
-    "SandboxMarkers",
-]
+_EXPORTS = {
+    "MVRClient": ".client",
+    "MVRApiClient": ".client",
+    "AsyncMVRClient": ".async_client",
+    "AsyncMVRApiClient": ".async_client",
+    "MVRApiError": ".client",
+    "MVRConfig": ".config",
+    "ResponseProfile": ".config",
+    "SandboxMarkers": ".models",
+    "EntityResolveRequest": ".models",
+    "build_entity_resolve_requests": ".models",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(__all__) | {"__version__"})
+
 
+if TYPE_CHECKING:
+    from .async_client import AsyncMVRApiClient, AsyncMVRClient
+    from .client import MVRApiClient, MVRApiError, MVRClient
+    from .config import MVRConfig, ResponseProfile
+    from .models import EntityResolveRequest, SandboxMarkers, build_entity_resolve_requests
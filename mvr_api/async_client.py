@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import asyncio
+from functools import partial
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Union
+
+import httpx
+
+from .client import (
+    _TRANSPORT_OPTIONS,
+    _BaseMVRClient,
+    _Payload,
+    _encode_payload,
+    _proxy_mounts,
+    _RetryPolicy,
+)
+from .config import MVRConfig
+
+
+class AsyncMVRClient(_BaseMVRClient):
+    """Asyncio variant of :class:`MVRClient` for concurrent batch workloads."""
+
+    def __init__(
+        self, config: Optional[MVRConfig] = None, *, transport: Optional[httpx.AsyncBaseTransport] = None, **kwargs: Any
+    ):
+        """``transport`` replaces the pooled, socket-tuned transport and its proxy mounts,
+        e.g. with ``httpx.MockTransport`` in tests; everything else is configured as usual."""
+        super().__init__(config, **kwargs)
+        self.client = httpx.AsyncClient(
+            transport=transport or httpx.AsyncHTTPTransport(**_TRANSPORT_OPTIONS),
+            mounts=_proxy_mounts(httpx.AsyncHTTPTransport) if transport is None else None,
+            **self._client_options(),
+        )
+
+    async def __aenter__(self) -> "AsyncMVRClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close pooled connections held by the underlying HTTP client."""
+        await self.client.aclose()
+
+    async def _request(
+        self, method: str, endpoint: str, payload: _Payload = None
+    ) -> Dict[str, Any]:
+        cache_key, cached = self._cache_lookup(endpoint, payload)
+        if cached is not None:
+            return cached
+        return self._cache_store(cache_key, endpoint, await self._send(method, endpoint, payload))
+
+    async def _send(
+        self,
+        method: str,
+        endpoint: str,
+        payload: _Payload = None,
+        headers: Optional[Dict[str, str]] = None,
+        allow_not_modified: bool = False,
+    ) -> httpx.Response:
+        """Send with retries; returns the accepted response, raises otherwise."""
+        content = _encode_payload(payload) if method.upper() != "GET" else None
+        policy = _RetryPolicy(self.config)
+        while True:
+            try:
+                response = await self.client.request(method, endpoint, content=content, headers=headers)
+            except httpx.HTTPError as exc:
+                delay = policy.after_error(exc)
+            else:
+                delay = policy.after_response(response, allow_not_modified)
+                if delay is None:
+                    return response
+            await asyncio.sleep(delay)
+
+    async def _gather(
+        self,
+        call: Callable[[Dict[str, Any]], Awaitable[Dict[str, Any]]],
+        payloads: List[Dict[str, Any]],
+        concurrency: int,
+    ) -> List[Dict[str, Any]]:
+        # Fail fast: the first error cancels the requests still queued or in flight
+        # instead of letting them run on with their results discarded.
+        if concurrency < 1:
+            raise ValueError(f"concurrency must be at least 1, got {concurrency!r}")
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def bounded(payload: Dict[str, Any]) -> Dict[str, Any]:
+            async with semaphore:
+                return await call(payload)
+
+        tasks = [asyncio.ensure_future(bounded(payload)) for payload in payloads]
+        try:
+            return list(await asyncio.gather(*tasks))
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+    async def auth_check(self) -> Dict[str, Any]:
+        return await self._request("POST", "/v1/auth-check", {})
+
+    async def entity_resolve(self, entity_name: str, country: Optional[str] = None, **extra: Any) -> Dict[str, Any]:
+        return await self._request(
+            "POST", "/v1/entity-resolve", self._entity_resolve_payload(entity_name, country, extra)
+        )
+
+    async def evidence_completeness(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        return await self._request("POST", "/v1/evidence-completeness", payload)
+
+    async def context_compile(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        return await self._request("POST", "/v1/context/compile", payload)
+
+    async def decision_check(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        return await self._request("POST", "/v1/decision-check", payload)
+
+    async def entity_resolve_many(self, payloads: List[Dict[str, Any]], concurrency: int = 32) -> List[Dict[str, Any]]:
+        """Resolve many entities concurrently; results keep the input order.
+
+        Build ``payloads`` with :func:`build_entity_resolve_requests`.
+        """
+        return await self._gather(partial(self._request, "POST", "/v1/entity-resolve"), payloads, concurrency)
+
+    async def evidence_completeness_many(
+        self, payloads: List[Dict[str, Any]], concurrency: int = 32
+    ) -> List[Dict[str, Any]]:
+        """Score many evidence packs concurrently; results keep the input order."""
+        return await self._gather(self.evidence_completeness, payloads, concurrency)
+
+    async def decision_check_many(self, payloads: List[Dict[str, Any]], concurrency: int = 32) -> List[Dict[str, Any]]:
+        """Run many decision checks concurrently; results keep the input order."""
+        return await self._gather(self.decision_check, payloads, concurrency)
+
+    async def post_raw(self, endpoint: str, body: Union[bytes, bytearray, memoryview]) -> Dict[str, Any]:
+        """POST a pre-encoded JSON ``body`` to ``endpoint`` without touching it.
+
+        Intended for hot batch loops that already hold serialized payloads. No
+        validation is done client-side; the caller is responsible for the shape.
+        ``body`` may be ``bytes``, ``bytearray`` or ``memoryview``; a ``str`` raises ``TypeError``.
+        """
+        return await self._request("POST", endpoint, body)
+
+    async def model_card(self) -> Dict[str, Any]:
+        return await self._request("GET", "/v1/model-card")
+
+    async def capabilities(self) -> Dict[str, Any]:
+        return await self._request("GET", "/v1/capabilities")
+
+    async def health(self) -> Dict[str, Any]:
+        """Return ``/health``, served from a local cache for ``config.health_ttl`` seconds."""
+        cached = self._health_snapshot()
+        fresh = self._fresh_health(cached)
+        return fresh if fresh is not None else await self._fetch_health(cached)
+
+    async def refresh_health(self) -> Dict[str, Any]:
+        """Fetch ``/health`` from the server, bypassing the local TTL and repopulating the cache."""
+        return await self._fetch_health(self._health_snapshot())
+
+    async def _fetch_health(self, cached: Optional[Tuple[float, Optional[str], Dict[str, Any]]]) -> Dict[str, Any]:
+        headers = self._health_headers(cached)
+        response = await self._send("GET", "/health", headers=headers, allow_not_modified=headers is not None)
+        return self._store_health(cached, response)
+
+
+AsyncMVRApiClient = AsyncMVRClient
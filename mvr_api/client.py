@@ -1,11 +1,25 @@
 from __future__ import annotations
 
+import copy
+import hashlib
+import ipaddress
+import json
+import random
+import socket
+import threading
 import time
-from typing import Any, Dict, Optional
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Dict, Optional, Tuple, Type, Union
+from urllib.request import getproxies
 
-import requests
+import httpx
 
-from .models import MVRConfig
+try:
+    import orjson
+except ImportError:  # optional error-envelope decoding speedup, installed via the "fast" extra
+    orjson = None
+
+from .config import MVRConfig
 
 
 class MVRApiError(Exception):
@@ -17,63 +31,456 @@ class MVRApiError(Exception):
         self.error_data = error_data or {}
 
 
-class MVRClient:
-    """Small Python client for the current MVR API v6.32.x public surface."""
+def _json_dumps(obj: Any, sort_keys: bool = False) -> bytes:
+    # Always the stdlib encoder: it rejects NaN/Infinity and non-JSON types, which orjson
+    # would silently write as null or serialize natively, and request bodies are small
+    # enough that encoding is never the bottleneck. orjson only decodes error envelopes.
+    # ensure_ascii escapes non-ASCII text, including lone surrogates that have no UTF-8 form.
+    return json.dumps(
+        obj, ensure_ascii=True, separators=(",", ":"), allow_nan=False, sort_keys=sort_keys
+    ).encode("ascii")
+
+
+def _json_loads(content: bytes) -> Any:
+    # Success bodies always go through the stdlib parser: orjson turns integers wider than
+    # 64 bits into floats, and returned data must not depend on the "fast" extra.
+    return json.loads(content)
+
+
+def _error_loads(content: bytes) -> Any:
+    # Error envelopes are small, flat {"error", "message"} objects, so orjson is safe here.
+    # It rejects NaN/Infinity, which json.loads accepts, so a decode error falls back.
+    if orjson is not None:
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(content)
+
+
+_RAW_BODY_TYPES = (bytes, bytearray, memoryview)
+_Payload = Union[Dict[str, Any], bytes, bytearray, memoryview, None]
+
+
+def _raw_body(payload: Any) -> Optional[bytes]:
+    # Pre-encoded bodies are sent byte-for-byte. A str is rejected rather than guessed at:
+    # its encoding is the caller's decision.
+    if isinstance(payload, str):
+        raise TypeError("pre-encoded bodies must be bytes-like, not str; encode the string first")
+    if isinstance(payload, _RAW_BODY_TYPES):
+        return bytes(payload)
+    return None
+
+
+def _encode_payload(payload: _Payload) -> Optional[bytes]:
+    # Encoded once per call so retries resend the same bytes instead of re-serializing.
+    if payload is None:
+        return None
+    raw = _raw_body(payload)
+    return raw if raw is not None else _json_dumps(payload)
+
+
+def _decode_body(
+    content: bytes, content_type: str = "application/json", loads: Callable[[bytes], Any] = _json_loads
+) -> Optional[Dict[str, Any]]:
+    # Parse the raw body bytes directly; ``None`` marks bodies labelled as something other
+    # than JSON (gateway HTML, plain-text errors) or that fail to parse.
+    if not content:
+        return {}
+    if "json" not in content_type.lower():
+        return None
+    try:
+        data = loads(content)
+    except ValueError:
+        return None
+    return data if isinstance(data, dict) else {"data": data}
+
+
+def _decode_response(response: httpx.Response, loads: Callable[[bytes], Any] = _json_loads) -> Dict[str, Any]:
+    # Non-JSON bodies skip the parser and keep their text.
+    data = _decode_body(response.content, response.headers.get("Content-Type", "application/json"), loads)
+    if data is None:
+        return {"error": "NON_JSON_RESPONSE", "message": response.text}
+    return data
+
+
+def _default_headers(config: MVRConfig) -> Tuple[Tuple[bytes, bytes], ...]:
+    # Pre-encoded once and set at client construction. Calls build no header dicts of
+    # their own, so each send only merges these already-normalised byte pairs.
+    return (
+        (b"Content-Type", b"application/json"),
+        (b"X-API-Key", config.api_key.encode("ascii")),
+        (b"X-Response-Profile", config.response_profile.encode("ascii")),
+        (b"User-Agent", b"mvr-api-py-client/6.32.1"),
+    )
+
+
+_POOL_LIMITS = httpx.Limits(max_keepalive_connections=20, max_connections=100)
+
+# Entity-resolve, decision-check, evidence-completeness and context-compile requests are
+# small JSON POSTs whose cost is mostly round-trip latency: disable Nagle so they are not
+# held back waiting for an ACK, and keep idle pooled connections alive through middleboxes.
+_SOCKET_OPTIONS = [
+    (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+    (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+    (socket.SOL_SOCKET, socket.SO_SNDBUF, 128 * 1024),
+]
+
+_TRANSPORT_OPTIONS: Dict[str, Any] = {
+    "http2": True,
+    "limits": _POOL_LIMITS,
+    "retries": 0,
+    "socket_options": _SOCKET_OPTIONS,
+}
+
+
+def _is_ip_address(host: str, version: int) -> bool:
+    try:
+        return ipaddress.ip_network(host, strict=False).version == version
+    except ValueError:
+        return False
+
+
+def _environment_proxies() -> Dict[str, Optional[str]]:
+    """HTTP(S)_PROXY / ALL_PROXY / NO_PROXY as httpx mount patterns, proxy URL or ``None``.
+
+    Mirrors the map httpx builds for itself (which it skips when a custom ``transport``
+    is supplied), but from the standard library so no private httpx API is involved.
+    """
+    proxies = getproxies()
+    patterns: Dict[str, Optional[str]] = {}
+    for scheme in ("http", "https", "all"):
+        proxy_url = proxies.get(scheme)
+        if proxy_url:
+            patterns[f"{scheme}://"] = proxy_url if "://" in proxy_url else f"http://{proxy_url}"
+    for host in (entry.strip() for entry in proxies.get("no", "").split(",")):
+        if host == "*":
+            return {}
+        if not host:
+            continue
+        if "://" in host:
+            patterns[host] = None
+        elif _is_ip_address(host, 4) or host.lower() == "localhost":
+            patterns[f"all://{host}"] = None
+        elif _is_ip_address(host, 6):
+            patterns[f"all://[{host}]"] = None
+        else:
+            patterns[f"all://*{host}"] = None
+    return patterns
+
+
+def _proxy_mounts(
+    transport_cls: Union[Type[httpx.HTTPTransport], Type[httpx.AsyncHTTPTransport]],
+) -> Dict[str, Any]:
+    """Mounts for the environment proxies, using the same socket-tuned transport.
+
+    ``None`` entries (NO_PROXY hosts) fall back to the client's default transport.
+    """
+    return {
+        pattern: None if proxy_url is None else transport_cls(proxy=httpx.Proxy(proxy_url), **_TRANSPORT_OPTIONS)
+        for pattern, proxy_url in _environment_proxies().items()
+    }
+
+
+_RETRY_STATUSES = (429, 503)
+_BACKOFF_BASE = 1.0
+_BACKOFF_CAP = 30.0
+
+
+def _retry_after(response: httpx.Response) -> Optional[float]:
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def _retry_delay(
+    attempt: int, waited: float, budget: float, response: Optional[httpx.Response] = None
+) -> Optional[float]:
+    """Seconds to wait before the next attempt, or ``None`` if it would push the total
+    backoff already ``waited`` past ``budget``.
+
+    A server-sent ``Retry-After`` wins; otherwise full-jitter exponential backoff keeps
+    concurrent clients from retrying in lockstep.
+    """
+    delay = _retry_after(response) if response is not None else None
+    if delay is None:
+        delay = random.uniform(0, min(_BACKOFF_CAP, _BACKOFF_BASE * 2**attempt))
+    if waited + delay > budget:
+        return None
+    return delay
+
+
+def _retry_budget(config: MVRConfig) -> float:
+    # Bounds the time spent sleeping between attempts only; time spent inside requests
+    # is governed by config.timeout and never consumes the retry budget. The backoff cap
+    # is added so a short timeout still leaves room for the jittered backoff itself.
+    return config.timeout * max(config.max_retries, 1) + _BACKOFF_CAP
+
+
+class _RetryPolicy:
+    """Retry decisions for one logical request, shared by the sync and async clients.
+
+    Holds no I/O: callers send, report each outcome here, and sleep for the returned
+    delay. Every returned delay is counted as slept against the retry budget.
+    """
+
+    def __init__(self, config: MVRConfig):
+        self._max_retries = config.max_retries
+        self._budget = _retry_budget(config)
+        self._attempt = 0
+        self._waited = 0.0
+
+    def _backoff(self, response: Optional[httpx.Response] = None) -> Optional[float]:
+        if self._attempt >= self._max_retries:
+            return None
+        delay = _retry_delay(self._attempt, self._waited, self._budget, response)
+        if delay is not None:
+            self._attempt += 1
+            self._waited += delay
+        return delay
+
+    def after_error(self, exc: httpx.HTTPError) -> float:
+        """Delay before retrying a transport failure; raises once retries are exhausted."""
+        delay = self._backoff()
+        if delay is None:
+            raise _network_error(exc) from exc
+        return delay
+
+    def after_response(self, response: httpx.Response, allow_not_modified: bool = False) -> Optional[float]:
+        """``None`` to accept ``response``, a delay to retry it, or raises the API error.
+
+        A 304 is only accepted when ``allow_not_modified`` is set, i.e. for conditional
+        requests whose caller holds the cached body.
+        """
+        status = response.status_code
+        if 200 <= status < 300 or (status == 304 and allow_not_modified):
+            return None
+        delay = self._backoff(response) if status in _RETRY_STATUSES else None
+        if delay is None:
+            raise _api_error(response, _decode_response(response, _error_loads))
+        return delay
+
+
+class _ResponseCache:
+    """Bounded per-endpoint TTL cache of successful responses, keyed by request hash.
+
+    Entries hold the raw JSON body; each hit decodes it afresh, which is cheaper than
+    deep-copying a decoded tree and still hands every caller its own objects.
+    """
+
+    def __init__(self, ttls: Dict[str, float], maxsize: int = 10_000):
+        self._ttls = ttls
+        self._maxsize = maxsize
+        self._entries: Dict[bytes, Tuple[float, bytes]] = {}
+        self._lock = threading.Lock()
+
+    def key(self, endpoint: str, payload: _Payload) -> Optional[bytes]:
+        if endpoint not in self._ttls:
+            return None
+        if payload is None:
+            body = b""
+        else:
+            body = _raw_body(payload)
+            if body is None:
+                try:
+                    body = _json_dumps(payload, sort_keys=True)
+                except TypeError:
+                    # Mixed int/str keys cannot be sorted; such requests skip the cache.
+                    return None
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(endpoint.encode("utf-8") + b"\n")
+        digest.update(body)
+        return digest.digest()
+
+    def get(self, key: bytes) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= time.monotonic():
+                del self._entries[key]
+                return None
+        return _decode_body(entry[1])
+
+    def put(self, key: bytes, endpoint: str, content: bytes) -> None:
+        expires_at = time.monotonic() + self._ttls[endpoint]
+        with self._lock:
+            self._entries.pop(key, None)
+            if len(self._entries) >= self._maxsize:
+                del self._entries[next(iter(self._entries))]
+            self._entries[key] = (expires_at, content)
+
+    def discard(self, key: Optional[bytes]) -> None:
+        if key is not None:
+            with self._lock:
+                self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+def _api_error(response: httpx.Response, data: Dict[str, Any]) -> MVRApiError:
+    message = data.get("message") or data.get("error") or f"MVR API HTTP {response.status_code}"
+    return MVRApiError(message, response.status_code, data)
+
+
+def _network_error(exc: httpx.HTTPError) -> MVRApiError:
+    return MVRApiError(str(exc), error_data={"error": "NETWORK_ERROR", "message": str(exc)})
+
+
+class _BaseMVRClient:
+    """State and decisions shared by :class:`MVRClient` and ``AsyncMVRClient``.
+
+    Response and health caching, 304 handling and retry policy live here without I/O;
+    subclasses only own the HTTP client and the send/sleep calls.
+    """
 
     def __init__(self, config: Optional[MVRConfig] = None, **kwargs: Any):
         self.config = config or MVRConfig(**kwargs)
-        self.session = requests.Session()
-        self.session.headers.update(
-            {
-                "Content-Type": "application/json",
-                "X-API-Key": self.config.api_key,
-                "X-Response-Profile": self.config.response_profile,
-                "User-Agent": "mvr-api-py-client/6.32.1",
-            }
-        )
+        self._health_cache: Optional[Tuple[float, Optional[str], Dict[str, Any]]] = None
+        self._health_lock = threading.Lock()
+        self._cache = _ResponseCache(self.config.cache_ttl) if self.config.cache_ttl else None
 
-    def _request(self, method: str, endpoint: str, payload: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-        url = f"{self.config.base_url.rstrip('/')}{endpoint}"
+    def _client_options(self) -> Dict[str, Any]:
+        return {
+            "base_url": self.config.base_url.rstrip("/"),
+            "headers": _default_headers(self.config),
+            "timeout": self.config.timeout,
+            "follow_redirects": True,
+        }
 
-        for attempt in range(self.config.max_retries + 1):
-            try:
-                response = self.session.request(
-                    method,
-                    url,
-                    json=payload if method.upper() != "GET" else None,
-                    timeout=self.config.timeout,
-                )
-                try:
-                    data = response.json()
-                except ValueError:
-                    data = {"error": "NON_JSON_RESPONSE", "message": response.text}
+    def _cache_lookup(
+        self, endpoint: str, payload: _Payload
+    ) -> Tuple[Optional[bytes], Optional[Dict[str, Any]]]:
+        cache_key = self._cache.key(endpoint, payload) if self._cache is not None else None
+        return cache_key, self._cache.get(cache_key) if cache_key is not None else None
 
-                if 200 <= response.status_code < 300:
-                    return data if isinstance(data, dict) else {"data": data}
+    def _cache_store(self, cache_key: Optional[bytes], endpoint: str, response: httpx.Response) -> Dict[str, Any]:
+        # Only bodies that decode as JSON are cached, so a hit never needs the response headers.
+        data = _decode_body(response.content, response.headers.get("Content-Type", "application/json"))
+        if data is None:
+            return _decode_response(response)
+        if cache_key is not None:
+            self._cache.put(cache_key, endpoint, response.content)
+        return data
 
-                if response.status_code == 429 and attempt < self.config.max_retries:
-                    retry_after = int(response.headers.get("Retry-After", "2"))
-                    time.sleep(retry_after)
-                    continue
+    def invalidate(self, endpoint: str, payload: _Payload = None) -> None:
+        """Drop the cached response for ``payload`` sent to ``endpoint``, if any."""
+        if self._cache is not None:
+            self._cache.discard(self._cache.key(endpoint, payload))
 
-                message = data.get("message") or data.get("error") or f"MVR API HTTP {response.status_code}"
-                raise MVRApiError(message, response.status_code, data)
+    def clear_cache(self) -> None:
+        """Drop every cached response."""
+        if self._cache is not None:
+            self._cache.clear()
 
-            except requests.RequestException as exc:
-                if attempt == self.config.max_retries:
-                    raise MVRApiError(str(exc), error_data={"error": "NETWORK_ERROR", "message": str(exc)}) from exc
-                time.sleep(2**attempt)
+    @staticmethod
+    def _entity_resolve_payload(entity_name: str, country: Optional[str], extra: Dict[str, Any]) -> Dict[str, Any]:
+        payload: Dict[str, Any] = {"entity_name": entity_name, **extra}
+        if country:
+            payload["country"] = country
+        return payload
+
+    def _health_snapshot(self) -> Optional[Tuple[float, Optional[str], Dict[str, Any]]]:
+        with self._health_lock:
+            return self._health_cache
+
+    def _fresh_health(self, cached: Optional[Tuple[float, Optional[str], Dict[str, Any]]]) -> Optional[Dict[str, Any]]:
+        if cached is not None and time.monotonic() - cached[0] < self.config.health_ttl:
+            return copy.deepcopy(cached[2])
+        return None
+
+    @staticmethod
+    def _health_headers(cached: Optional[Tuple[float, Optional[str], Dict[str, Any]]]) -> Optional[Dict[str, str]]:
+        # Revalidate with the last ETag; a 304 reuses the cached body instead of a full download.
+        etag = cached[1] if cached is not None else None
+        return {"If-None-Match": etag} if etag else None
+
+    def _store_health(
+        self, cached: Optional[Tuple[float, Optional[str], Dict[str, Any]]], response: httpx.Response
+    ) -> Dict[str, Any]:
+        if response.status_code == 304 and cached is not None:
+            etag, data = cached[1], cached[2]
+        else:
+            # Like the response cache, only bodies that decode as JSON are kept.
+            decoded = _decode_body(response.content, response.headers.get("Content-Type", "application/json"))
+            if decoded is None:
+                return _decode_response(response)
+            etag, data = response.headers.get("ETag"), decoded
+        with self._health_lock:
+            self._health_cache = (time.monotonic(), etag, data)
+        return copy.deepcopy(data)
+
+
+class MVRClient(_BaseMVRClient):
+    """Small Python client for the current MVR API v6.32.x public surface."""
+
+    def __init__(
+        self, config: Optional[MVRConfig] = None, *, transport: Optional[httpx.BaseTransport] = None, **kwargs: Any
+    ):
+        """``transport`` replaces the pooled, socket-tuned transport and its proxy mounts,
+        e.g. with ``httpx.MockTransport`` in tests; everything else is configured as usual."""
+        super().__init__(config, **kwargs)
+        self.client = httpx.Client(
+            transport=transport or httpx.HTTPTransport(**_TRANSPORT_OPTIONS),
+            mounts=_proxy_mounts(httpx.HTTPTransport) if transport is None else None,
+            **self._client_options(),
+        )
+
+    def __enter__(self) -> "MVRClient":
+        return self
 
-        raise MVRApiError("MVR API request failed", error_data={"error": "UNKNOWN_ERROR"})
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close pooled connections held by the underlying HTTP client."""
+        self.client.close()
+
+    def _request(
+        self, method: str, endpoint: str, payload: _Payload = None
+    ) -> Dict[str, Any]:
+        cache_key, cached = self._cache_lookup(endpoint, payload)
+        if cached is not None:
+            return cached
+        return self._cache_store(cache_key, endpoint, self._send(method, endpoint, payload))
+
+    def _send(
+        self,
+        method: str,
+        endpoint: str,
+        payload: _Payload = None,
+        headers: Optional[Dict[str, str]] = None,
+        allow_not_modified: bool = False,
+    ) -> httpx.Response:
+        """Send with retries; returns the accepted response, raises otherwise."""
+        content = _encode_payload(payload) if method.upper() != "GET" else None
+        policy = _RetryPolicy(self.config)
+        while True:
+            try:
+                response = self.client.request(method, endpoint, content=content, headers=headers)
+            except httpx.HTTPError as exc:
+                delay = policy.after_error(exc)
+            else:
+                delay = policy.after_response(response, allow_not_modified)
+                if delay is None:
+                    return response
+            time.sleep(delay)
 
     def auth_check(self) -> Dict[str, Any]:
         return self._request("POST", "/v1/auth-check", {})
 
     def entity_resolve(self, entity_name: str, country: Optional[str] = None, **extra: Any) -> Dict[str, Any]:
-        payload: Dict[str, Any] = {"entity_name": entity_name, **extra}
-        if country:
-            payload["country"] = country
-        return self._request("POST", "/v1/entity-resolve", payload)
+        return self._request("POST", "/v1/entity-resolve", self._entity_resolve_payload(entity_name, country, extra))
 
     def evidence_completeness(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         return self._request("POST", "/v1/evidence-completeness", payload)
@@ -84,6 +491,15 @@ class MVRClient:
     def decision_check(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         return self._request("POST", "/v1/decision-check", payload)
 
+    def post_raw(self, endpoint: str, body: Union[bytes, bytearray, memoryview]) -> Dict[str, Any]:
+        """POST a pre-encoded JSON ``body`` to ``endpoint`` without touching it.
+
+        Intended for hot batch loops that already hold serialized payloads. No
+        validation is done client-side; the caller is responsible for the shape.
+        ``body`` may be ``bytes``, ``bytearray`` or ``memoryview``; a ``str`` raises ``TypeError``.
+        """
+        return self._request("POST", endpoint, body)
+
     def model_card(self) -> Dict[str, Any]:
         return self._request("GET", "/v1/model-card")
 
@@ -91,7 +507,19 @@ class MVRClient:
         return self._request("GET", "/v1/capabilities")
 
     def health(self) -> Dict[str, Any]:
-        return self._request("GET", "/health")
+        """Return ``/health``, served from a local cache for ``config.health_ttl`` seconds."""
+        cached = self._health_snapshot()
+        fresh = self._fresh_health(cached)
+        return fresh if fresh is not None else self._fetch_health(cached)
+
+    def refresh_health(self) -> Dict[str, Any]:
+        """Fetch ``/health`` from the server, bypassing the local TTL and repopulating the cache."""
+        return self._fetch_health(self._health_snapshot())
+
+    def _fetch_health(self, cached: Optional[Tuple[float, Optional[str], Dict[str, Any]]]) -> Dict[str, Any]:
+        headers = self._health_headers(cached)
+        response = self._send("GET", "/health", headers=headers, allow_not_modified=headers is not None)
+        return self._store_health(cached, response)
 
 
 MVRApiClient = MVRClient
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass, field
+from typing import Any, Dict, Literal, Optional, Type, Union, get_args
+
+
+ResponseProfile = Literal["full_advisory", "strict_calibrated"]
+
+
+def _number(name: str, value: Any, kind: Type[Union[int, float]]) -> Union[int, float]:
+    # Lax coercion in the spirit of the former Pydantic model: "2" and 2.0 become 2 for an
+    # int field, but fractional or non-numeric values are rejected up front.
+    try:
+        number = kind(value)
+        if kind is int and number != float(value):
+            raise ValueError
+    except (TypeError, ValueError, OverflowError):
+        raise ValueError(f"{name} must be {'an integer' if kind is int else 'a number'}, got {value!r}") from None
+    return number
+
+
+@dataclass
+class MVRConfig:
+    """Configuration for the MVR API client."""
+
+    api_key: str = field(default_factory=lambda: os.getenv("MVR_API_KEY", "mvr-demo-key-2026"))
+    base_url: str = "https://africanmarketos.com"
+    timeout: float = 90.0
+    max_retries: int = 1
+    health_ttl: float = 600.0
+    cache_ttl: Optional[Dict[str, float]] = None
+    response_profile: ResponseProfile = "full_advisory"
+
+    def __post_init__(self) -> None:
+        self.timeout = _number("timeout", self.timeout, float)
+        self.max_retries = _number("max_retries", self.max_retries, int)
+        self.health_ttl = _number("health_ttl", self.health_ttl, float)
+        if self.cache_ttl is not None:
+            # Copied so later changes to the caller's dict never reach the client's cache.
+            self.cache_ttl = {
+                endpoint: _number(f"cache_ttl[{endpoint!r}]", ttl, float) for endpoint, ttl in self.cache_ttl.items()
+            }
+        if self.response_profile not in get_args(ResponseProfile):
+            raise ValueError(f"Unsupported response_profile: {self.response_profile!r}")
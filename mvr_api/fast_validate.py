@@ -0,0 +1,23 @@
+"""Precompiled JSON Schema validators for gateway-style ingest loops.
+
+Requires the optional ``fastjsonschema`` dependency (``pip install "mvr-api-client[validate]"``).
+Each validator is compiled once at import from the Pydantic model's JSON Schema and
+checks plain dicts without building a model, returning the dict unchanged or raising
+``JsonSchemaException``. Validated rows can be sent with ``MVRClient.entity_resolve(**row)``
+or encoded in bulk and sent with ``MVRClient.post_raw``.
+"""
+
+from __future__ import annotations
+
+import fastjsonschema
+from fastjsonschema import JsonSchemaException
+
+from .models import EntityResolveRequest
+
+# use_default=False: a validator must not inject schema defaults (e.g. "country": null)
+# into the caller's payload.
+validate_entity_resolve_request = fastjsonschema.compile(
+    EntityResolveRequest.model_json_schema(), use_default=False
+)
+
+__all__ = ["JsonSchemaException", "validate_entity_resolve_request"]
@@ -1,22 +1,62 @@
 from __future__ import annotations
 
-import os
-from typing import Literal, Optional
+import math
+from typing import Any, Dict, List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, TypeAdapter, model_validator
 
+from .config import MVRConfig, ResponseProfile  # noqa: F401 - re-exported
 
-class MVRConfig(BaseModel):
-    """Configuration for the MVR API client."""
 
-    api_key: str = Field(default_factory=lambda: os.getenv("MVR_API_KEY", "mvr-demo-key-2026"))
-    base_url: str = "https://africanmarketos.com"
-    timeout: float = 90.0
-    max_retries: int = 1
-    response_profile: Literal["full_advisory", "strict_calibrated"] = "full_advisory"
+class _ResponseModel(BaseModel):
+    """Base for read-only blocks parsed out of API responses."""
 
+    model_config = ConfigDict(extra="ignore", frozen=True, populate_by_name=True)
 
-class SandboxMarkers(BaseModel):
+
+class SandboxMarkers(_ResponseModel):
     environment: Optional[str] = None
     illustrative_only: Optional[bool] = None
     not_for_production: Optional[bool] = None
+
+    @classmethod
+    def from_response(cls, data: Dict[str, Any]) -> "SandboxMarkers":
+        """Read the sandbox markers from a response's ``response_meta`` block."""
+        return cls.model_validate(data.get("response_meta") or {})
+
+
+class EntityResolveRequest(BaseModel):
+    """Payload for ``POST /v1/entity-resolve``; extra keys are passed through."""
+
+    model_config = ConfigDict(extra="allow")
+
+    entity_name: str
+    country: Optional[str] = None
+
+    @model_validator(mode="before")
+    @classmethod
+    def _nan_to_none(cls, data: Any) -> Any:
+        # DataFrame.to_dict("records") reports missing cells as float NaN.
+        if isinstance(data, dict):
+            return {
+                key: None if isinstance(value, float) and math.isnan(value) else value
+                for key, value in data.items()
+            }
+        return data
+
+
+_ENTITY_RESOLVE_BATCH = TypeAdapter(List[EntityResolveRequest])
+
+
+def build_entity_resolve_requests(rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Validate a batch of rows (e.g. ``df.to_dict("records")``) in a single pass.
+
+    Missing (NaN) cells become ``None``. A missing ``country`` is omitted, as in
+    ``entity_resolve``; other ``None`` values are kept and sent as ``null``.
+    Returns JSON-ready payloads for ``entity_resolve_many`` or ``post_raw``.
+    """
+    payloads = _ENTITY_RESOLVE_BATCH.dump_python(_ENTITY_RESOLVE_BATCH.validate_python(rows), mode="json")
+    for payload in payloads:
+        if payload.get("country") is None:
+            del payload["country"]
+    return payloads
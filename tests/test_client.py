@@ -0,0 +1,579 @@
+import asyncio
+import datetime
+import http.server
+import json
+import math
+import threading
+import uuid
+
+import httpx
+import pytest
+
+from mvr_api import AsyncMVRClient, MVRApiError, MVRClient
+from mvr_api import async_client as async_client_module
+from mvr_api import client as client_module
+from mvr_api.client import _json_dumps
+
+
+def make_client(handler, client_cls=MVRClient, **config):
+    """Build a fully configured client whose HTTP calls are answered by ``handler``."""
+    config.setdefault("base_url", "https://mvr.test")
+    return client_cls(transport=httpx.MockTransport(handler), **config)
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Record backoff sleeps instead of sleeping; jitter always picks its upper bound."""
+    recorded = []
+
+    async def fake_async_sleep(delay):
+        recorded.append(delay)
+
+    monkeypatch.setattr(client_module.time, "sleep", recorded.append)
+    monkeypatch.setattr(async_client_module.asyncio, "sleep", fake_async_sleep)
+    monkeypatch.setattr(client_module.random, "uniform", lambda low, high: high)
+    return recorded
+
+
+class Sequence:
+    """MockTransport handler replaying canned responses (or exceptions), then 200s."""
+
+    def __init__(self, *steps):
+        self.steps = list(steps)
+        self.requests = []
+
+    def __call__(self, request):
+        self.requests.append(request)
+        step = self.steps.pop(0) if self.steps else httpx.Response(200, json={"ok": True})
+        if isinstance(step, Exception):
+            raise step
+        return step
+
+
+@pytest.mark.parametrize("value", [math.nan, math.inf, -math.inf])
+def test_encoder_rejects_non_finite_floats(value):
+    with pytest.raises(ValueError):
+        _json_dumps({"entity_name": "A", "score": value})
+
+
+@pytest.mark.parametrize("value", [datetime.date(2026, 1, 1), uuid.uuid4(), {1, 2}, object()])
+def test_encoder_rejects_non_json_types(value):
+    with pytest.raises(TypeError):
+        _json_dumps({"value": value})
+
+
+def test_encoder_is_compact_ascii_and_sorts_on_request():
+    payload = {"entity_name": "Ünïcode", "country": None, "n": [1, 2.5, True], "nested": {"b": 1, "a": 2}}
+    assert _json_dumps(payload) == (
+        b'{"entity_name":"\\u00dcn\\u00efcode","country":null,"n":[1,2.5,true],"nested":{"b":1,"a":2}}'
+    )
+    assert _json_dumps(payload, sort_keys=True) == (
+        b'{"country":null,"entity_name":"\\u00dcn\\u00efcode","n":[1,2.5,true],"nested":{"a":2,"b":1}}'
+    )
+    assert _json_dumps({1: "int key", 2: 2**70, "t": (1, 2)}) == b'{"1":"int key","2":1180591620717411303424,"t":[1,2]}'
+
+
+def test_lone_surrogate_is_escaped_and_sent():
+    handler = Sequence()
+    api = make_client(handler)
+    assert api.entity_resolve("bad\udcff") == {"ok": True}
+    assert handler.requests[0].content == b'{"entity_name":"bad\\udcff"}'
+    assert json.loads(handler.requests[0].content) == {"entity_name": "bad\udcff"}
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        b'{"entity_name":"\xc3\x9cn\xc3\xafcode","n":[1,2.5,true,null]}',
+        b'{"score":NaN,"upper":Infinity,"lower":-Infinity}',
+        b'{"id":123456789012345678901234567890,"neg":-9223372036854775809,"max":18446744073709551615}',
+        b'[1,2,3]',
+    ],
+)
+def test_decoder_matches_stdlib(content):
+    decoded = client_module._json_loads(content)
+    expected = json.loads(content)
+    assert repr(decoded) == repr(expected)
+
+
+def test_decoder_keeps_wide_integers_exact():
+    content = b'{"id":123456789012345678901234567890,"neg":-9223372036854775809}'
+    assert client_module._json_loads(content) == json.loads(content)
+    response = httpx.Response(200, content=content, headers={"Content-Type": "application/json"})
+    assert repr(client_module._decode_response(response)) == repr(json.loads(content))
+
+
+@pytest.mark.parametrize("content", [b'{"error":"BAD","message":"nope"}', b'{"score":NaN}'])
+def test_error_decoder_matches_stdlib(content):
+    assert repr(client_module._error_loads(content)) == repr(json.loads(content))
+
+
+def test_decoder_rejects_invalid_json():
+    with pytest.raises(ValueError):
+        client_module._json_loads(b"<html>")
+
+
+def test_decode_response_accepts_non_finite_numbers():
+    response = httpx.Response(200, content=b'{"score":NaN}', headers={"Content-Type": "application/json"})
+    data = client_module._decode_response(response)
+    assert list(data) == ["score"] and math.isnan(data["score"])
+
+
+def test_encode_payload_passes_bytes_through():
+    assert client_module._encode_payload(b'{"a":1}') == b'{"a":1}'
+    assert client_module._encode_payload(None) is None
+    cache = client_module._ResponseCache({"/x": 60})
+    assert cache.key("/x", b"{}") == cache.key("/x", bytearray(b"{}")) == cache.key("/x", memoryview(b"{}"))
+
+
+@pytest.mark.parametrize("client_cls", [MVRClient, AsyncMVRClient])
+@pytest.mark.parametrize("wrap", [bytes, bytearray, memoryview])
+def test_post_raw_sends_body_byte_for_byte(client_cls, wrap):
+    body = '{"entity_name": "Ünïcode",  "n":1.0}\n'.encode()
+    handler = Sequence()
+    api = make_client(handler, client_cls)
+    result = api.post_raw("/v1/entity-resolve", wrap(body))
+    if client_cls is AsyncMVRClient:
+        result = asyncio.run(result)
+    assert result == {"ok": True}
+    assert handler.requests[0].content == body
+
+
+def test_post_raw_rejects_str():
+    handler = Sequence()
+    api = make_client(handler, cache_ttl={"/v1/entity-resolve": 60})
+    with pytest.raises(TypeError):
+        api.post_raw("/v1/entity-resolve", '{"entity_name":"A"}')
+    assert handler.requests == []
+
+
+@pytest.mark.parametrize("content_type", ["application/json", "Application/JSON; charset=UTF-8"])
+def test_decode_response_json_content_type_is_case_insensitive(content_type):
+    response = httpx.Response(200, content=b'{"ok":true}', headers={"Content-Type": content_type})
+    assert client_module._decode_response(response) == {"ok": True}
+
+
+def test_decode_response_empty_body_is_empty_dict():
+    assert client_module._decode_response(httpx.Response(204)) == {}
+    api = make_client(lambda request: httpx.Response(200, headers={"Content-Type": "application/json"}))
+    assert api.decision_check({"a": 1}) == {}
+
+
+def test_decode_response_keeps_non_json_text():
+    response = httpx.Response(502, text="<html>Bad Gateway</html>", headers={"Content-Type": "text/html"})
+    assert client_module._decode_response(response) == {
+        "error": "NON_JSON_RESPONSE",
+        "message": "<html>Bad Gateway</html>",
+    }
+
+
+def test_read_timeout_retried_with_default_config(sleeps):
+    handler = Sequence(httpx.ReadTimeout("slow"))
+    api = make_client(handler)
+    assert api.model_card() == {"ok": True}
+    assert len(handler.requests) == 2
+
+
+def test_request_time_does_not_consume_retry_budget(sleeps):
+    handler = Sequence(*[httpx.ReadTimeout("slow")] * 4)
+    api = make_client(handler, timeout=1, max_retries=3)
+    with pytest.raises(MVRApiError) as excinfo:
+        api.model_card()
+    assert excinfo.value.error_data["error"] == "NETWORK_ERROR"
+    assert len(handler.requests) == 4
+
+
+def test_backoff_sleeps_are_bounded_by_budget(sleeps):
+    handler = Sequence(*[httpx.ConnectError("down")] * 8)
+    api = make_client(handler, timeout=1, max_retries=7)
+    with pytest.raises(MVRApiError):
+        api.model_card()
+    # Budget is 1 * 7 + 30 = 37s: backoff of 1 + 2 + 4 + 8 + 16 fits, the next 30s would not.
+    assert sleeps == [1.0, 2.0, 4.0, 8.0, 16.0]
+    assert len(handler.requests) == 6
+
+
+@pytest.mark.parametrize("status", [429, 503])
+def test_retry_after_is_honoured(sleeps, status):
+    handler = Sequence(httpx.Response(status, headers={"Retry-After": "3"}))
+    api = make_client(handler)
+    assert api.model_card() == {"ok": True}
+    assert sleeps == [3.0]
+
+
+def test_retry_after_beyond_budget_raises_without_retrying(sleeps):
+    handler = Sequence(httpx.Response(429, headers={"Retry-After": "120"}, json={"message": "slow down"}))
+    api = make_client(handler, timeout=1, max_retries=3)
+    with pytest.raises(MVRApiError, match="slow down") as excinfo:
+        api.model_card()
+    assert excinfo.value.status_code == 429
+    assert sleeps == []
+    assert len(handler.requests) == 1
+
+
+def test_non_retryable_status_raises_immediately(sleeps):
+    handler = Sequence(httpx.Response(500, text="<html>", headers={"Content-Type": "text/html"}))
+    api = make_client(handler, max_retries=3)
+    with pytest.raises(MVRApiError) as excinfo:
+        api.model_card()
+    assert excinfo.value.error_data == {"error": "NON_JSON_RESPONSE", "message": "<html>"}
+    assert len(handler.requests) == 1
+
+
+def test_async_read_timeout_retried(sleeps):
+    handler = Sequence(httpx.ReadTimeout("slow"), httpx.Response(503))
+    api = make_client(handler, AsyncMVRClient, timeout=1, max_retries=2)
+    assert asyncio.run(api.model_card()) == {"ok": True}
+    assert len(handler.requests) == 3
+    assert sleeps == [1.0, 2.0]
+
+
+def test_cache_key_is_canonical_and_hits_skip_network():
+    handler = Sequence()
+    api = make_client(handler, cache_ttl={"/v1/entity-resolve": 60})
+    first = api.entity_resolve("MTN", country="NG")
+    second = api._request("POST", "/v1/entity-resolve", {"country": "NG", "entity_name": "MTN"})
+    assert first == second == {"ok": True}
+    assert len(handler.requests) == 1
+
+    api.entity_resolve("MTN", country="KE")
+    api.decision_check({"a": 1})
+    api.decision_check({"a": 1})
+    assert len(handler.requests) == 4  # different payload, and an uncached endpoint
+
+
+def test_cache_returns_isolated_copies():
+    handler = Sequence(httpx.Response(200, json={"nested": {"a": 1}}))
+    api = make_client(handler, cache_ttl={"/v1/model-card": 60})
+    api.model_card()["nested"]["a"] = 99
+    assert api.model_card() == {"nested": {"a": 1}}
+    assert len(handler.requests) == 1
+
+
+def test_cache_skips_payloads_without_canonical_form():
+    handler = Sequence()
+    api = make_client(handler, cache_ttl={"/v1/decision-check": 60})
+    assert api.decision_check({1: "a", "b": 2}) == api.decision_check({1: "a", "b": 2}) == {"ok": True}
+    assert len(handler.requests) == 2
+    assert handler.requests[0].content == b'{"1":"a","b":2}'
+
+
+def test_cache_skips_non_json_bodies():
+    handler = Sequence(httpx.Response(200, text="<html>", headers={"Content-Type": "text/html"}))
+    api = make_client(handler, cache_ttl={"/v1/model-card": 60})
+    assert api.model_card() == {"error": "NON_JSON_RESPONSE", "message": "<html>"}
+    assert api.model_card() == {"ok": True}
+    assert api.model_card() == {"ok": True}
+    assert len(handler.requests) == 2
+
+
+def test_cache_invalidate_and_clear():
+    handler = Sequence()
+    api = make_client(handler, cache_ttl={"/v1/entity-resolve": 60, "/v1/model-card": 60})
+    api.entity_resolve("MTN", country="NG")
+    api.model_card()
+    api.invalidate("/v1/entity-resolve", {"entity_name": "MTN", "country": "NG"})
+    api.entity_resolve("MTN", country="NG")
+    api.model_card()
+    assert len(handler.requests) == 3
+    api.clear_cache()
+    api.model_card()
+    assert len(handler.requests) == 4
+
+
+def test_cache_does_not_store_errors(sleeps):
+    handler = Sequence(httpx.Response(400, json={"message": "bad"}))
+    api = make_client(handler, cache_ttl={"/v1/model-card": 60})
+    with pytest.raises(MVRApiError):
+        api.model_card()
+    assert api.model_card() == {"ok": True}
+
+
+def test_response_cache_ttl_expiry():
+    cache = client_module._ResponseCache({"/fresh": 60, "/stale": 0})
+    for endpoint in ("/fresh", "/stale"):
+        cache.put(cache.key(endpoint, None), endpoint, json.dumps({"endpoint": endpoint}).encode())
+    assert cache.get(cache.key("/fresh", None)) == {"endpoint": "/fresh"}
+    assert cache.get(cache.key("/stale", None)) is None
+    assert cache.key("/uncached", None) is None
+
+
+def test_response_cache_evicts_oldest_entry():
+    cache = client_module._ResponseCache({"/e": 60}, maxsize=2)
+    keys = [cache.key("/e", {"i": i}) for i in range(3)]
+    for i, key in enumerate(keys):
+        cache.put(key, "/e", b'{"i":%d}' % i)
+    assert cache.get(keys[0]) is None
+    assert cache.get(keys[1]) == {"i": 1}
+    assert cache.get(keys[2]) == {"i": 2}
+
+
+def test_async_client_uses_response_cache():
+    handler = Sequence()
+    api = make_client(handler, AsyncMVRClient, cache_ttl={"/v1/entity-resolve": 60})
+
+    async def run():
+        return [await api.entity_resolve("X"), await api.entity_resolve("X")]
+
+    assert asyncio.run(run()) == [{"ok": True}, {"ok": True}]
+    assert len(handler.requests) == 1
+
+
+class Fanout:
+    """Async MockTransport handler echoing request bodies while tracking concurrency."""
+
+    def __init__(self, fail_on=None):
+        self.fail_on = fail_on
+        self.in_flight = 0
+        self.peak = 0
+        self.completed = 0
+
+    async def __call__(self, request):
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            body = client_module._json_loads(request.content)
+            if body == self.fail_on:
+                return httpx.Response(400, json={"error": "BAD_REQUEST"})
+            await asyncio.sleep(0.01)
+            self.completed += 1
+            return httpx.Response(200, json=body)
+        finally:
+            self.in_flight -= 1
+
+
+def test_many_keeps_input_order_and_bounds_concurrency():
+    handler = Fanout()
+    payloads = [{"i": i} for i in range(20)]
+    api = make_client(handler, AsyncMVRClient)
+    assert asyncio.run(api.decision_check_many(payloads, concurrency=3)) == payloads
+    assert handler.peak == 3
+
+
+def test_many_failure_cancels_outstanding_requests():
+    handler = Fanout(fail_on={"i": 0})
+    payloads = [{"i": i} for i in range(20)]
+    api = make_client(handler, AsyncMVRClient)
+
+    async def main():
+        with pytest.raises(MVRApiError) as exc_info:
+            await api.decision_check_many(payloads, concurrency=4)
+        # Checked before asyncio.run() tears the loop down and reaps leftover tasks.
+        assert handler.in_flight == 0
+        return exc_info.value
+
+    assert asyncio.run(main()).status_code == 400
+    assert handler.completed == 0
+
+
+@pytest.mark.parametrize("concurrency", [0, -1])
+def test_many_rejects_non_positive_concurrency(concurrency):
+    api = make_client(Sequence(), AsyncMVRClient)
+    with pytest.raises(ValueError):
+        asyncio.run(api.decision_check_many([{"i": 1}], concurrency=concurrency))
+
+
+class ETagServer:
+    """Serves /health with an ETag and answers matching If-None-Match with 304."""
+
+    def __init__(self, etag='"v1"'):
+        self.etag = etag
+        self.conditional = []
+
+    def __call__(self, request):
+        self.conditional.append(request.headers.get("If-None-Match"))
+        if request.headers.get("If-None-Match") == self.etag:
+            return httpx.Response(304, headers={"ETag": self.etag})
+        return httpx.Response(200, json={"status": "ok", "etag": self.etag}, headers={"ETag": self.etag})
+
+
+def test_health_is_cached_for_ttl():
+    server = ETagServer()
+    api = make_client(server)
+    assert api.health() == api.health() == {"status": "ok", "etag": '"v1"'}
+    assert server.conditional == [None]
+
+
+def test_health_does_not_cache_non_json_bodies():
+    handler = Sequence(httpx.Response(200, text="<html>", headers={"Content-Type": "text/html"}))
+    api = make_client(handler)
+    assert api.health() == {"error": "NON_JSON_RESPONSE", "message": "<html>"}
+    assert api.health() == api.health() == {"ok": True}
+    assert len(handler.requests) == 2
+
+
+def test_health_revalidates_with_etag():
+    server = ETagServer()
+    api = make_client(server, health_ttl=0)
+    assert api.health() == {"status": "ok", "etag": '"v1"'}
+    assert api.health() == {"status": "ok", "etag": '"v1"'}
+    assert api.refresh_health() == {"status": "ok", "etag": '"v1"'}
+    assert server.conditional == [None, '"v1"', '"v1"']
+
+    server.etag = '"v2"'
+    assert api.refresh_health() == {"status": "ok", "etag": '"v2"'}
+    assert api.refresh_health() == {"status": "ok", "etag": '"v2"'}
+    assert server.conditional[-1] == '"v2"'
+
+
+def test_async_health_revalidates_with_etag():
+    server = ETagServer()
+    api = make_client(server, AsyncMVRClient, health_ttl=0)
+
+    async def run():
+        return [await api.health(), await api.refresh_health()]
+
+    assert asyncio.run(run()) == [{"status": "ok", "etag": '"v1"'}] * 2
+    assert server.conditional == [None, '"v1"']
+
+
+def test_unsolicited_304_is_an_error_and_not_cached():
+    handler = Sequence(httpx.Response(304))
+    api = make_client(handler, cache_ttl={"/v1/model-card": 60})
+    with pytest.raises(MVRApiError) as excinfo:
+        api.model_card()
+    assert excinfo.value.status_code == 304
+    assert api.model_card() == {"ok": True}
+    assert len(handler.requests) == 2
+
+
+@pytest.fixture
+def clean_proxy_env(monkeypatch):
+    for name in ("HTTP_PROXY", "HTTPS_PROXY", "ALL_PROXY", "NO_PROXY"):
+        monkeypatch.delenv(name, raising=False)
+        monkeypatch.delenv(name.lower(), raising=False)
+    return monkeypatch
+
+
+@pytest.fixture
+def local_server():
+    """Plain-HTTP server on 127.0.0.1 recording each request target (absolute when proxied)."""
+    targets = []
+
+    class Handler(http.server.BaseHTTPRequestHandler):
+        def do_GET(self):
+            targets.append(self.path)
+            body = json.dumps({"target": self.path}).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}", targets
+    server.shutdown()
+    server.server_close()
+
+
+def call(api, method):
+    if isinstance(api, AsyncMVRClient):
+
+        async def run():
+            async with api:
+                return await getattr(api, method)()
+
+        return asyncio.run(run())
+    with api:
+        return getattr(api, method)()
+
+
+def test_environment_proxies_map(clean_proxy_env):
+    clean_proxy_env.setenv("HTTP_PROXY", "proxy.internal:3128")
+    clean_proxy_env.setenv("ALL_PROXY", "socks5://socks.internal:1080")
+    clean_proxy_env.setenv("NO_PROXY", "127.0.0.1, ::1,localhost,.corp,10.0.0.0/8,http://plain.test,")
+    assert client_module._environment_proxies() == {
+        "http://": "http://proxy.internal:3128",
+        "all://": "socks5://socks.internal:1080",
+        "all://127.0.0.1": None,
+        "all://[::1]": None,
+        "all://localhost": None,
+        "all://*.corp": None,
+        "all://10.0.0.0/8": None,
+        "http://plain.test": None,
+    }
+    clean_proxy_env.setenv("NO_PROXY", "*")
+    assert client_module._environment_proxies() == {}
+
+
+@pytest.mark.parametrize("client_cls", [MVRClient, AsyncMVRClient])
+def test_requests_go_through_environment_proxy(clean_proxy_env, local_server, client_cls):
+    proxy_url, targets = local_server
+    clean_proxy_env.setenv("HTTP_PROXY", proxy_url)
+    api = client_cls(base_url="http://mvr.invalid")
+    assert call(api, "model_card") == {"target": "http://mvr.invalid/v1/model-card"}
+    assert targets == ["http://mvr.invalid/v1/model-card"]
+
+
+@pytest.mark.parametrize("client_cls", [MVRClient, AsyncMVRClient])
+def test_no_proxy_hosts_bypass_the_proxy(clean_proxy_env, local_server, client_cls):
+    server_url, targets = local_server
+    clean_proxy_env.setenv("HTTP_PROXY", "http://127.0.0.1:9")  # nothing listens here
+    clean_proxy_env.setenv("NO_PROXY", "127.0.0.1")
+    api = client_cls(base_url=server_url)
+    assert call(api, "model_card") == {"target": "/v1/model-card"}
+    assert targets == ["/v1/model-card"]
+
+
+@pytest.mark.parametrize("client_cls", [MVRClient, AsyncMVRClient])
+def test_redirects_are_followed(client_cls):
+    def handler(request):
+        if request.url.host == "mvr.test":
+            return httpx.Response(301, headers={"Location": f"https://www.mvr.test{request.url.path}"})
+        return httpx.Response(200, json={"host": request.url.host, "path": request.url.path})
+
+    api = make_client(handler, client_cls)
+    result = api.model_card()
+    if client_cls is AsyncMVRClient:
+        result = asyncio.run(result)
+    assert result == {"host": "www.mvr.test", "path": "/v1/model-card"}
+
+
+@pytest.mark.parametrize("client_cls", [MVRClient, AsyncMVRClient])
+def test_default_headers_and_timeout(client_cls):
+    handler = Sequence()
+    api = make_client(handler, client_cls, api_key="test-key", response_profile="strict_calibrated", timeout=7)
+    result = api.decision_check({"a": 1})
+    if client_cls is AsyncMVRClient:
+        result = asyncio.run(result)
+    assert result == {"ok": True}
+
+    request = handler.requests[0]
+    assert request.headers["Content-Type"] == "application/json"
+    assert request.headers["X-API-Key"] == "test-key"
+    assert request.headers["X-Response-Profile"] == "strict_calibrated"
+    assert request.headers["User-Agent"] == "mvr-api-py-client/6.32.1"
+    assert request.content == b'{"a":1}'
+    assert request.extensions["timeout"] == {"connect": 7, "read": 7, "write": 7, "pool": 7}
+
+
+def test_config_coerces_numeric_fields():
+    api = make_client(Sequence(), timeout="30", max_retries="2", health_ttl=5)
+    assert (api.config.timeout, api.config.max_retries, api.config.health_ttl) == (30.0, 2, 5.0)
+    assert isinstance(api.config.max_retries, int)
+
+
+@pytest.mark.parametrize(
+    "field, value", [("timeout", "soon"), ("max_retries", "2.5"), ("max_retries", 1.5), ("health_ttl", None)]
+)
+def test_config_rejects_non_numeric_fields(field, value):
+    with pytest.raises(ValueError, match=field):
+        MVRClient(**{field: value})
+
+
+def test_config_coerces_and_copies_cache_ttl():
+    ttls = {"/v1/model-card": "60"}
+    handler = Sequence()
+    api = make_client(handler, cache_ttl=ttls)
+    ttls["/v1/model-card"] = "bad"
+    ttls["/v1/capabilities"] = 60
+    assert api.config.cache_ttl == {"/v1/model-card": 60.0}
+    assert api.model_card() == api.model_card() == {"ok": True}
+    assert len(handler.requests) == 1
+    with pytest.raises(ValueError, match="cache_ttl"):
+        MVRClient(cache_ttl={"/v1/model-card": "soon"})
@@ -0,0 +1,27 @@
+import pytest
+
+pytest.importorskip("fastjsonschema")
+
+from mvr_api.fast_validate import JsonSchemaException, validate_entity_resolve_request  # noqa: E402
+
+
+def test_valid_row_passes_unchanged():
+    row = {"entity_name": "MTN Nigeria", "country": "NG"}
+    assert validate_entity_resolve_request(row) == {"entity_name": "MTN Nigeria", "country": "NG"}
+
+
+@pytest.mark.parametrize("row", [{"country": "NG"}, {"entity_name": 42}, {"entity_name": None}])
+def test_missing_or_non_string_name_is_rejected(row):
+    with pytest.raises(JsonSchemaException):
+        validate_entity_resolve_request(row)
+
+
+def test_extra_keys_pass_through():
+    row = {"entity_name": "Safaricom", "sector": "telco", "alias": None}
+    assert validate_entity_resolve_request(row) == {"entity_name": "Safaricom", "sector": "telco", "alias": None}
+
+
+def test_schema_defaults_are_not_injected():
+    row = {"entity_name": "Safaricom"}
+    assert "country" not in validate_entity_resolve_request(row)
+    assert row == {"entity_name": "Safaricom"}
@@ -0,0 +1,33 @@
+import math
+
+import pytest
+from pydantic import ValidationError
+
+from mvr_api import SandboxMarkers, build_entity_resolve_requests
+
+
+def test_build_entity_resolve_requests_handles_dataframe_nan():
+    rows = [
+        {"entity_name": "MTN Nigeria", "country": "NG", "sector": math.nan},
+        {"entity_name": "Safaricom", "country": math.nan, "sector": "telco"},
+    ]
+    assert build_entity_resolve_requests(rows) == [
+        {"entity_name": "MTN Nigeria", "country": "NG", "sector": None},
+        {"entity_name": "Safaricom", "sector": "telco"},
+    ]
+
+
+def test_build_entity_resolve_requests_keeps_none_extras():
+    rows = [{"entity_name": "A", "country": None, "alias": None}]
+    assert build_entity_resolve_requests(rows) == [{"entity_name": "A", "alias": None}]
+
+
+def test_build_entity_resolve_requests_rejects_missing_name():
+    with pytest.raises(ValidationError):
+        build_entity_resolve_requests([{"entity_name": math.nan, "country": "NG"}])
+
+
+def test_sandbox_markers_from_response():
+    markers = SandboxMarkers.from_response({"response_meta": {"environment": "sandbox", "unknown": 1}})
+    assert markers.environment == "sandbox"
+    assert SandboxMarkers.from_response({}) == SandboxMarkers()
@@ -0,0 +1,14 @@
+import subprocess
+import sys
+
+import mvr_api
+
+
+def test_dir_lists_only_public_api():
+    assert dir(mvr_api) == sorted(set(mvr_api.__all__) | {"__version__"})
+
+
+def test_client_import_does_not_load_pydantic():
+    code = "import sys; from mvr_api import MVRClient, MVRConfig; print('pydantic' in sys.modules)"
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "False"